@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import timedelta
 
@@ -18,6 +19,7 @@ from .const import (
     CONF_POLL_INTERVAL,
     CONF_VERIFY_SSL,
     CONF_LEGACY_SSL,
+    MAX_STALE_POLLS,
 )
 from .spc import (
     create_spc_session,
@@ -45,7 +47,7 @@ async def async_setup_entry(hass, entry):
 
     if legacy_ssl:
         spc = create_legacy_ssl_spc_session(url, userid, password)
-        close_spc = spc.session.aclose
+        close_spc = spc.client.aclose
     else:
         spc = create_spc_session(hass, url, userid, password,
                                  verify_ssl=verify_ssl)
@@ -53,20 +55,59 @@ async def async_setup_entry(hass, entry):
 
     await spc.login()
 
-    async def update():
-        try:
-            return {
-                "arm_state": await spc.get_arm_state(),
-                "zones": {zone["zone_id"]: zone
-                          for zone in await spc.get_zones()},
-            }
-
-        except SPCError as error:
+    def update_failed(error):
+        if isinstance(error, SPCError):
             # Treat as hard failure. Show unavailable.
-            raise UpdateFailed(str(error)) from error
+            return UpdateFailed(str(error))
+        return UpdateFailed(f"SPC communication error: {error!s}")
+
+    # Consecutive failed polls of each half of the update.
+    failed_polls = {"arm_state": 0, "zones": 0}
 
-        except (httpx.HTTPError, ValueError) as error:
-            raise UpdateFailed(f"SPC communication error: {error!s}") from error
+    def keep_previous(key, error):
+        if failed_polls[key] > MAX_STALE_POLLS:
+            raise update_failed(error) from error
+        LOGGER.warning("Keeping previous %s (failed poll %d of %d): %s",
+                       key, failed_polls[key], MAX_STALE_POLLS, error)
+
+    async def update():
+        arm_state, zones = await asyncio.gather(
+            spc.get_arm_state(),
+            spc.get_zones(),
+            return_exceptions=True,
+        )
+
+        errors = [result for result in (arm_state, zones)
+                  if isinstance(result, BaseException)]
+        for error in errors:
+            if not isinstance(error, (SPCError, httpx.HTTPError, ValueError)):
+                raise error
+
+        for key, result in (("arm_state", arm_state), ("zones", zones)):
+            if isinstance(result, BaseException):
+                failed_polls[key] += 1
+            else:
+                failed_polls[key] = 0
+
+        # If only one of the requests failed, keep its previous value
+        # instead of marking every entity unavailable, but only for a
+        # few polls so that a lasting failure does not go unnoticed.
+        previous = coordinator.data
+        if len(errors) == 2 or (errors and previous is None):
+            raise update_failed(errors[0]) from errors[0]
+
+        if isinstance(arm_state, BaseException):
+            keep_previous("arm_state", arm_state)
+            arm_state = previous["arm_state"]
+
+        if isinstance(zones, BaseException):
+            keep_previous("zones", zones)
+            zones = previous["zones"].values()
+
+        return {
+            "arm_state": arm_state,
+            "zones": {zone.zone_id: zone for zone in zones},
+        }
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -88,14 +129,20 @@ async def async_setup_entry(hass, entry):
         "serial_number": spc.serial_number,
     })
 
+    # Every platform asks for the same zone devices; build each only once.
+    zone_device_infos = {}
+
     def get_zone_device_info(zone):
-        return DeviceInfo({
-            "identifiers": {(DOMAIN, f"{spc.serial_number}-zone{zone["zone_id"]}")},
-            "name": f"Zone {zone["zone_id"]} {zone["zone_name"]}",
-            "manufacturer": MANUFACTURER,
-            "model": f"{spc.model} Zone",
-            "via_device": alarm_device_id,
-        })
+        device_info = zone_device_infos.get(zone.zone_id)
+        if device_info is None:
+            device_info = zone_device_infos[zone.zone_id] = DeviceInfo({
+                "identifiers": {(DOMAIN, f"{spc.serial_number}-zone{zone.zone_id}")},
+                "name": f"Zone {zone.zone_id} {zone.zone_name}",
+                "manufacturer": MANUFACTURER,
+                "model": f"{spc.model} Zone",
+                "via_device": alarm_device_id,
+            })
+        return device_info
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
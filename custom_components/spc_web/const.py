@@ -10,6 +10,10 @@ CONF_LEGACY_SSL = "legacy_ssl"
 
 DEFAULT_POLL_INTERVAL = 30
 
+# Consecutive polls for which a failed half of the update may fall back
+# to its previous value before the whole update fails.
+MAX_STALE_POLLS = 3
+
 PLATFORMS = [
     "alarm_control_panel",
     "binary_sensor",
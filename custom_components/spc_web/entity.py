@@ -0,0 +1,36 @@
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+
+class SPCZoneEntity(CoordinatorEntity):
+    """Base class for entities showing a value of a single SPC zone.
+
+    Subclasses implement _get_zone_value() and report _zone_value from
+    their state property. The state is only written when the value or
+    the availability changes."""
+
+    def __init__(self, coordinator, zone):
+        super().__init__(coordinator)
+
+        self._zone_id = zone.zone_id
+        self._zone = zone
+        self._zone_value = self._get_zone_value(zone)
+        self._written_state = (self.available, self._zone_value)
+
+    def _get_zone_value(self, zone):
+        """Return the entity value for the zone (None if it's gone)."""
+        raise NotImplementedError
+
+    @callback
+    def _handle_coordinator_update(self):
+        # Zones that did not change are the same object as last time
+        # (see SPCSession.get_zones), so the value can be kept as is.
+        zone = self.coordinator.data["zones"].get(self._zone_id)
+        if zone is not self._zone:
+            self._zone = zone
+            self._zone_value = self._get_zone_value(zone)
+
+        state = (self.available, self._zone_value)
+        if state != self._written_state:
+            self._written_state = state
+            self.async_write_ha_state()
@@ -1,10 +1,10 @@
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
 )
 
 from .const import DOMAIN
+from .entity import SPCZoneEntity
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -16,25 +16,19 @@ async def async_setup_entry(hass, entry, async_add_entities):
     get_zone_device_info = data["get_zone_device_info"]
     unique_prefix = data["unique_prefix"]
 
-    for zone in coordinator.data["zones"].values():
-        device_info = get_zone_device_info(zone)
-        async_add_entities([
-            SPCZoneInput(
-                coordinator=coordinator,
-                device_info=device_info,
-                unique_prefix=unique_prefix,
-                zone=zone,
-            ),
-            SPCZoneStatus(
-                coordinator=coordinator,
-                device_info=device_info,
-                unique_prefix=unique_prefix,
-                zone=zone,
-            ),
-        ])
-
-
-class SPCZoneInput(CoordinatorEntity, SensorEntity):
+    async_add_entities([
+        entity_class(
+            coordinator=coordinator,
+            device_info=get_zone_device_info(zone),
+            unique_prefix=unique_prefix,
+            zone=zone,
+        )
+        for zone in coordinator.data["zones"].values()
+        for entity_class in (SPCZoneInput, SPCZoneStatus)
+    ])
+
+
+class SPCZoneInput(SPCZoneEntity, SensorEntity):
     """Enum sensor representing SPC input state."""
 
     _attr_device_class = SensorDeviceClass.ENUM
@@ -54,23 +48,24 @@ class SPCZoneInput(CoordinatorEntity, SensorEntity):
     ]
 
     def __init__(self, coordinator, device_info, unique_prefix, zone):
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone)
 
-        zone_id = zone["zone_id"]
+        zone_id = zone.zone_id
 
-        self._zone_id = zone_id
         self._attr_name = "Input"
         self._attr_unique_id = f"{unique_prefix}-zone{zone_id}-input"
         self._attr_device_info = device_info
 
+    def _get_zone_value(self, zone):
+        if zone:
+            return zone.input
+
     @property
     def native_value(self):
-        zone = self.coordinator.data["zones"].get(self._zone_id)
-        if zone:
-            return zone["input"]
+        return self._zone_value
 
 
-class SPCZoneStatus(CoordinatorEntity, SensorEntity):
+class SPCZoneStatus(SPCZoneEntity, SensorEntity):
     """Enum sensor representing SPC zone status."""
 
     _attr_device_class = SensorDeviceClass.ENUM
@@ -90,17 +85,18 @@ class SPCZoneStatus(CoordinatorEntity, SensorEntity):
     ]
 
     def __init__(self, coordinator, device_info, unique_prefix, zone):
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone)
 
-        zone_id = zone["zone_id"]
+        zone_id = zone.zone_id
 
-        self._zone_id = zone_id
         self._attr_name = "Status"
         self._attr_unique_id = f"{unique_prefix}-zone{zone_id}-status"
         self._attr_device_info = device_info
 
+    def _get_zone_value(self, zone):
+        if zone:
+            return zone.status
+
     @property
     def native_value(self):
-        zone = self.coordinator.data["zones"].get(self._zone_id)
-        if zone:
-            return zone["status"]
+        return self._zone_value
@@ -1,6 +1,10 @@
+import asyncio
+import functools
 import logging
 import re
 import ssl
+import sys
+from dataclasses import dataclass
 
 import httpx
 
@@ -22,12 +26,8 @@ RE_SESSION = re.compile(
 )
 
 # Page: login
-RE_LOGIN = re.compile(
-    r"\baction=login\b",
-    re.IGNORECASE
-)
-RE_DENIED = re.compile(
-    r"\bAccess\s+denied\b",
+RE_LOGIN_STATE = re.compile(
+    r"(?P<login>\baction=login\b)|(?P<denied>\bAccess\s+denied\b)",
     re.IGNORECASE
 )
 
@@ -37,26 +37,38 @@ RE_ARM_STATE = re.compile(
     re.IGNORECASE,
 )
 RE_IMPORTANT = re.compile(
-    r"<font[^>]*color=red[^>]*><b>(.*?)</b></font>",
-    re.IGNORECASE | re.DOTALL
+    # message up to </b></font>, written so that it never backtracks
+    r"<font[^>]*color=red[^>]*><b>([^<]*(?:<(?!/b></font>)[^<]*)*)</b></font>",
+    re.IGNORECASE
 )
 
 # Page: status_zones
 RE_ZONE = re.compile(
     r"<TR\s+HEIGHT=20>"
-    # (1) zone id, (2) zone name
-    r"\s*<TD\s+ALIGN=\"center\">(\d+)\s+([^<]+)</TD>"
-    # (3) area id, (4) area name
-    r"\s*<TD\s+ALIGN=\"center\">(\d+)\s+([^<]+)</TD>"
-    # (5) zone type
-    r"\s*<TD\s+ALIGN=\"center\">([^<]+)</TD>"
-    # (6) (commented out) input state
-    r".*?<!--.*?<font[^>]*>(?:<b>)?([^<]+)(?:</b>)?</font>.*?-->"
-    # (7) status
-    r"\s*<TD\s+ALIGN=\"center\"><FONT\s+COLOR=\w+>(?:<B>)?([^<]+)(?:</B>)?</FONT></TD>",
-    re.IGNORECASE | re.DOTALL
+    r"\s*<TD\s+ALIGN=\"center\">(?P<zone_id>\d+)\s+(?P<zone_name>[^<]+)</TD>"
+    r"\s*<TD\s+ALIGN=\"center\">(?P<area_id>\d+)\s+(?P<area_name>[^<]+)</TD>"
+    r"\s*<TD\s+ALIGN=\"center\">(?P<zone_type>[^<]+)</TD>"
+    # (commented out) input state; none of the gaps may run into another
+    # row, so a row without the comment is skipped instead of borrowing
+    # the next row's, and the loops are written so they never backtrack
+    r"[^<]*(?:<(?!!--|/?TR\b)[^<]*)*<!--"
+    r"[^<]*(?:<(?!font\b|/?TR\b)[^<]*)*"
+    r"<font[^>]*>(?:<b>)?(?P<input>[^<]+)(?:</b>)?</font>"
+    r"[^<-]*(?:(?:-(?!->)|<(?!/?TR\b))[^<-]*)*-->"
+    r"\s*<TD\s+ALIGN=\"center\"><FONT\s+COLOR=\w+>(?:<B>)?(?P<status>[^<]+)(?:</B>)?</FONT></TD>",
+    re.IGNORECASE
 )
 
+# Form data to send to system_summary for each arm state
+ARM_STATE_FORMS = {
+    "unset": {"unset_all_areas": "Unset"},
+    "fullset": {"fullset_area1": "Fullset"},
+    "forceset": {"fullset_force1": "Force set"},
+}
+
+# Cache for _normalize(), by raw text as found on the page
+_NORMALIZED = {}
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -72,18 +84,36 @@ def create_legacy_ssl_spc_session(url, userid, password):
     """Create an instance of SPCSession using a custom httpx client that
     is configured for legacy TLS. This version can connect to the SPC
     panel over HTTPS directly.
+    Connections are kept alive between requests, so reuse the returned
+    session for polling instead of creating one per request.
     Await session.client.aclose() to release the underlying httpx client."""
 
+    # The legacy TLS handshake is the most expensive part of talking to
+    # the panel, so keep connections open long enough to span polls.
+    transport = httpx.AsyncHTTPTransport(
+        verify=get_legacy_ssl_context(),
+        http2=False,
+        limits=httpx.Limits(
+            max_connections=4,
+            max_keepalive_connections=4,
+            keepalive_expiry=120.0,
+        ),
+        retries=1,
+    )
     client = httpx.AsyncClient(
         timeout=httpx.Timeout(10.0),
-        verify=get_legacy_ssl_context(),
+        transport=transport,
+        # The panel's pages are Latin-1 unless they say otherwise.
+        default_encoding="latin-1",
     )
     return SPCSession(client, url, userid, password)
 
 
+@functools.lru_cache(maxsize=1)
 def get_legacy_ssl_context():
     """
     SSL context compatible with SPC panels.
+    Built once and shared by all sessions.
 
     SPC requires:
     - TLS 1.2 only
@@ -104,11 +134,13 @@ def get_legacy_ssl_context():
 def parse_title(html):
     """Return [model, site] parsed from the HTML title, falling back to blanks."""
     re_match = RE_TITLE.search(html)
-    if re_match:
-        result = (re_match.group(1).split(" - ", 1) + [""])[:2]
-    else:
-        result = ("", "")
-    return [s.strip() for s in result]
+    return split_title(re_match.group(1) if re_match else "")
+
+
+def split_title(title):
+    """Return [model, site] split from a page title, falling back to blanks."""
+    model, _, site = title.partition(" - ")
+    return [model.strip(), site.strip()]
 
 
 def parse_serial_number(html):
@@ -117,14 +149,21 @@ def parse_serial_number(html):
 
 
 def parse_session_id(html):
-    re_match = RE_SESSION.search(html)
-    if re_match:
-        return re_match.group(1)
+    # Locate the first candidate with a plain substring search and only
+    # run the regex from there.
+    idx = html.find("session=0x")
+    if idx >= 0:
+        re_match = RE_SESSION.search(html, max(idx - 1, 0))
+        if re_match:
+            return re_match.group(1)
     raise SPCParseError("Session ID not found in HTML")
 
 
 def parse_system_summary_arm_state(html):
-    re_match = RE_ARM_STATE.search(html)
+    # A case-insensitive search can't skip ahead on its own; start it
+    # at the row label if it's spelled the usual way.
+    idx = html.find(">All Areas<")
+    re_match = RE_ARM_STATE.search(html, max(idx, 0))
     if re_match:
         return re_match.group(1).strip().lower()
     raise SPCParseError("Arm state not found in HTML")
@@ -136,29 +175,53 @@ def parse_system_summary_important_message(html):
         return re_match.group(1).strip()
 
 
+def _normalize(s):
+    # Raw cell text -> stripped, lowercased, interned string. Only a
+    # handful of distinct values exist, so after the first poll this
+    # is a single dict lookup. Interning makes comparisons against the
+    # literals in the entity code ("actuated", ...) identity checks.
+    try:
+        return _NORMALIZED[s]
+    except KeyError:
+        value = _NORMALIZED[s] = sys.intern(s.strip().lower())
+        return value
+
+
 def parse_status_zones(html):
     for m in RE_ZONE.finditer(html):
-        yield {
-            "zone_id": int(m.group(1)),
-            "zone_name": m.group(2).strip(),
-            "area_id": int(m.group(3)),
-            "area_name": m.group(4).strip(),
-            # Alarm, Entry/Exit, ...
-            "zone_type": m.group(5).strip().lower(),
-            # For inhibited zones, this shows the underlying status
-            # Open, Closed, DISCON, ...
-            "input": m.group(6).strip().lower(),
-            # Normal, Tamper, Inhibit, ...
-            "status": m.group(7).strip().lower(),
-        }
+        # Unpacked in RE_ZONE's group order, which is cheaper than
+        # looking each group up by name.
+        zone_id, zone_name, area_id, area_name, zone_type, input_, status = (
+            m.groups())
+        yield Zone(
+            int(zone_id),
+            zone_name.strip(),
+            int(area_id),
+            area_name.strip(),
+            _normalize(zone_type),
+            _normalize(input_),
+            _normalize(status),
+        )
 
 
-def is_login_page(html):
-    return bool(RE_LOGIN.search(html))
+def parse_login_state(html):
+    """Return "login" for the login page, "denied" for the login page
+    with an access denied notice, or None for any other page."""
 
+    # Case-insensitive regex searches can't use a fast literal scan, and
+    # almost every page we check is not the login page. Rule that out
+    # with a plain substring search on a lowercased copy first.
+    if "action=login" not in html.lower():
+        return None
 
-def is_login_access_denied(html):
-    return bool(RE_DENIED.search(html))
+    found = set()
+    for m in RE_LOGIN_STATE.finditer(html):
+        found.add(m.lastgroup)
+        if len(found) == 2:
+            break
+    if "login" not in found:
+        return None
+    return ("denied" if "denied" in found else "login")
 
 
 class SPCError(Exception):
@@ -177,123 +240,176 @@ class SPCCommandError(SPCError):
     pass
 
 
+@dataclass(slots=True)
+class Zone:
+    """State of a single zone as shown on the status_zones page."""
+
+    zone_id: int
+    zone_name: str
+    area_id: int
+    area_name: str
+    zone_type: str      # alarm, entry/exit, ...
+    input: str          # open, closed, discon, ... (underlying if inhibited)
+    status: str         # normal, tamper, inhibit, ...
+
+
 class SPCSession:
     """Represents a web session with the SPC panel."""
 
     def __init__(self, client, url, userid, password):
         self.client = client
         self.url = url.rstrip("/")
+        self._login_url = self._secure_url = None   # set by _login()
         self.creds = {
             "userid": userid,
             "password": password,
         }
 
-        self.sid = ""               # session ID
+        self._set_sid("")           # session ID and secure queries
         self.model = ""             # panel model name
         self.serial_number = ""     # panel serial number
         self.site = ""              # alarm site name
 
-    async def _request(self, method, path, params=None, data=None):
+        # Serializes logins so that concurrent requests hitting an
+        # expired session only log in once.
+        self._login_lock = asyncio.Lock()
+
+        # Zones returned by the previous get_zones() call, by zone ID.
+        self._last_zones = {}
+
+    def _set_sid(self, sid):
+        """Set the session ID and build the query strings of the
+        secure pages, which only change along with it."""
+
+        self.sid = sid
+
+        summary = {"language": "0", "session": sid, "page": "system_summary"}
+        zones = {"language": "0", "session": sid, "page": "status_zones"}
+        self._secure_params = {
+            "system_summary": summary,
+            "system_summary_update": summary | {"action": "update"},
+            "status_zones": zones,
+            "status_zones_update": zones | {
+                "action": "update",
+                # XXX website always sends this for some reason
+                "zone": "1",
+            },
+        }
+
+    async def _request(self, method, url, params, data=None):
         resp = await self.client.request(
-            method, self.url + path,
-            params={
-                "language": "0",
-            } | (params or {}),
+            method, url,
+            params=params,
             data=data,
         )
 
+        # Being redirected to the login page is conclusive on its own.
+        # An unfollowed redirect has no page to look at, so stop there.
+        if resp.is_redirect:
+            location = resp.headers.get("location", "")
+            if location.partition("?")[0].endswith("/login.htm"):
+                return "", "login"
+
         resp.raise_for_status()
         html = resp.text
 
-        self.model, self.site = parse_title(html)
-        return html
-
-    async def _do_with_login(self, do):
-        if self.sid:
-            html = await do()
-            if not is_login_page(html):
+        # A followed redirect did fetch the login page; check it anyway,
+        # so that an "access denied" notice on it is still reported.
+        login_state = parse_login_state(html)
+        if (not login_state and resp.history
+                and resp.url.path.endswith("/login.htm")):
+            login_state = "login"
+        return html, login_state
+
+    async def _secure_request(self, method, query, data=None):
+        """Request secure.htm with one of the query strings built by
+        _set_sid(), logging in (again) first if needed."""
+
+        sid = self.sid
+        if sid:
+            html, login_state = await self._request(
+                method, self._secure_url, self._secure_params[query], data)
+            if not login_state:
                 return html
-        await self.login()
-        return await do()
+        async with self._login_lock:
+            # Another request may have logged in while we were waiting.
+            if self.sid == sid:
+                await self._login()
+        html, _ = await self._request(
+            method, self._secure_url, self._secure_params[query], data)
+        return html
 
     async def login(self):
         """Log in and populate sid, serial, model, and site."""
 
-        html = await self._request(
-            "POST", "/login.htm",
-            params={"action": "login"},
+        async with self._login_lock:
+            await self._login()
+
+    async def _login(self):
+        # Parsed here rather than in __init__ so that a malformed URL
+        # is reported by login() like any other connection problem.
+        self._login_url = httpx.URL(self.url + "/login.htm")
+        self._secure_url = httpx.URL(self.url + "/secure.htm")
+
+        html, login_state = await self._request(
+            "POST", self._login_url,
+            params={"language": "0", "action": "login"},
             data=self.creds,
         )
 
-        if is_login_page(html):
-            if is_login_access_denied(html):
-                raise SPCLoginError("SPC login failed: access denied")
+        if login_state == "denied":
+            raise SPCLoginError("SPC login failed: access denied")
+        if login_state:
             raise SPCLoginError("SPC login failed: still on login page")
 
-        self.sid = parse_session_id(html)
+        self._set_sid(parse_session_id(html))
         self.serial_number = parse_serial_number(html)
+        self.model, self.site = parse_title(html)
 
     async def get_arm_state(self):
         """Fetch current arm state (all areas)."""
 
-        async def do():
-            return await self._request(
-                "GET", "/secure.htm",
-                params={
-                    "session": self.sid,
-                    "page": "system_summary",
-                },
-            )
-
-        html = await self._do_with_login(do)
+        html = await self._secure_request("GET", "system_summary")
         return parse_system_summary_arm_state(html)
 
     async def set_arm_state(self, arm_state):
         """Send a command to change the arm state (all areas).
         Returns the new arm state (as returned by SPC)."""
 
-        if arm_state == "unset":
-            data = {"unset_all_areas": "Unset"}
-        elif arm_state == "fullset":
-            data = {"fullset_area1": "Fullset"}
-        elif arm_state == "forceset":
-            data = {"fullset_force1": "Force set"}
-        else:
+        data = ARM_STATE_FORMS.get(arm_state)
+        if data is None:
             raise SPCCommandError(f"{arm_state}: unknown arm state")
 
-        async def do():
-            return await self._request(
-                "POST", "/secure.htm",
-                params={
-                    "session": self.sid,
-                    "page": "system_summary",
-                    "action": "update",
-                },
-                data=data,
-            )
-
-        html = await self._do_with_login(do)
+        html = await self._secure_request(
+            "POST", "system_summary_update", data)
         msg = parse_system_summary_important_message(html)
         if msg:
             raise SPCCommandError(msg)
         return parse_system_summary_arm_state(html)
 
     async def get_zones(self):
-        """Fetch a list of zones. Each zone is a dictionary with
-        following keys: zone_id, zone_name, area_id, area_name,
-        zone_type, input, status."""
-
-        async def do():
-            return await self._request(
-                "GET", "/secure.htm",
-                params={
-                    "session": self.sid,
-                    "page": "status_zones",
-                },
-            )
-
-        html = await self._do_with_login(do)
-        return list(parse_status_zones(html))
+        """Fetch the zones. Returns an iterator of Zone instances,
+        parsed lazily as it is consumed. Consume it exactly once and
+        fully: unchanged zones are only recognized on the next call
+        after the whole iterator has been read."""
+
+        html = await self._secure_request("GET", "status_zones")
+        return self._reuse_unchanged_zones(parse_status_zones(html))
+
+    def _reuse_unchanged_zones(self, zones):
+        # Hand out the previous object for zones that did not change so
+        # that comparing consecutive polls short-circuits on identity.
+        # The cache is only replaced once all zones have been seen, so
+        # an abandoned iteration leaves the previous one intact.
+        last_zones = self._last_zones
+        current_zones = {}
+        for zone in zones:
+            last = last_zones.get(zone.zone_id)
+            if last == zone:
+                zone = last
+            current_zones[zone.zone_id] = zone
+            yield zone
+        self._last_zones = current_zones
 
     async def set_zone_inhibit(self, zone_id, inhibit):
         """Inhibit or deinhibit a zone. Returns the new state
@@ -304,19 +420,7 @@ class SPCSession:
         else:
             data = {f"uninhibit{zone_id}": "Deinhibit"}
 
-        async def do():
-            return await self._request(
-                "POST", "/secure.htm",
-                params={
-                    "session": self.sid,
-                    "page": "status_zones",
-                    "action": "update",
-                    # XXX website always sends this for some reason
-                    "zone": "1",
-                },
-                data=data,
-            )
-
-        html = await self._do_with_login(do)
+        html = await self._secure_request(
+            "POST", "status_zones_update", data)
         return next((zone for zone in parse_status_zones(html)
-                     if zone["zone_id"] == zone_id), None)
+                     if zone.zone_id == zone_id), None)
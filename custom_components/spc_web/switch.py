@@ -1,8 +1,8 @@
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN
+from .entity import SPCZoneEntity
 from .spc import SPCError
 
 
@@ -28,29 +28,30 @@ async def async_setup_entry(hass, entry, async_add_entities):
     ])
 
 
-class SPCZoneInhibit(CoordinatorEntity, SwitchEntity):
+class SPCZoneInhibit(SPCZoneEntity, SwitchEntity):
     """Switch representing SPC zone inhibit state."""
 
     _attr_has_entity_name = True
 
     def __init__(self, coordinator, spc, device_info, unique_prefix, zone):
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone)
         self.spc = spc
 
-        zone_id = zone["zone_id"]
+        zone_id = zone.zone_id
 
-        self._zone_id = zone_id
         self._attr_name = "Inhibit"
         self._attr_unique_id = f"{unique_prefix}-zone{zone_id}-inhibit"
         self._attr_device_info = device_info
 
-    @property
-    def is_on(self):
-        zone = self.coordinator.data["zones"].get(self._zone_id)
+    def _get_zone_value(self, zone):
         if zone:
-            return (zone["status"] == "inhibit")
+            return (zone.status == "inhibit")
         return False
 
+    @property
+    def is_on(self):
+        return self._zone_value
+
     async def _async_set_inhibit(self, inhibited):
         try:
             await self.spc.set_zone_inhibit(self._zone_id, inhibited)